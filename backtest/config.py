@@ -3,3 +3,4 @@ COMMISSION_PCT = 0.001  # 0.1%
 DEFAULT_TICKER = "SPY"
 DEFAULT_START = "2018-01-01"
 DEFAULT_END = "2023-12-31"
+TRADING_DAYS_PER_YEAR = 252
@@ -1,25 +1,50 @@
+import functools
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
-import yfinance as yf
 
 CACHE_DIR = Path(".cache")
 
+PRICE_COLUMNS = ["Open", "High", "Low", "Close"]
 
+
+def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store prices as float32 and Volume as int32, halving the cached frame in
+    memory and on disk. Strategies and the engine read Close as a float64 copy,
+    so every rolling pass and all cash/equity arithmetic still runs in float64.
+    """
+    df[PRICE_COLUMNS] = df[PRICE_COLUMNS].astype(np.float32)
+    # Volume can exceed int32 on very liquid tickers — only downcast when it fits
+    if df["Volume"].max() <= np.iinfo(np.int32).max:
+        df["Volume"] = df["Volume"].astype(np.int32)
+    return df
+
+
+@functools.lru_cache(maxsize=32)
 def fetch_data(ticker: str, start: str, end: str) -> pd.DataFrame:
-    """Download OHLCV daily data for a ticker, caching results to .cache/."""
-    cache_path = CACHE_DIR / f"{ticker}_{start}_{end}.csv"
+    """
+    Download OHLCV daily data for a ticker, caching results to .cache/ as Parquet.
+
+    Results are also memoized in-process per (ticker, start, end), so repeated
+    calls in one run return the same DataFrame object — treat it as read-only.
+    """
+    cache_path = CACHE_DIR / f"{ticker}_{start}_{end}.parquet"
 
     if cache_path.exists():
-        df = pd.read_csv(cache_path, index_col="Date", parse_dates=True)
-        return df
+        # Parquet keeps the DatetimeIndex and the downcast dtypes as written
+        return pd.read_parquet(cache_path, engine="pyarrow")
+
+    import yfinance as yf  # heavy import, only needed on a cache miss
 
     CACHE_DIR.mkdir(exist_ok=True)
 
     raw = yf.Ticker(ticker).history(start=start, end=end, auto_adjust=True)
     df = raw[["Open", "High", "Low", "Close", "Volume"]].copy()
     df.index.name = "Date"
-    df.index = df.index.tz_localize(None)  # strip timezone for clean CSV round-tripping
+    df.index = df.index.tz_localize(None)  # strip timezone: the engine works in naive datetime64
+    df = _downcast(df)
 
-    df.to_csv(cache_path)
+    df.to_parquet(cache_path, engine="pyarrow", compression="zstd")
     return df
@@ -1,51 +1,138 @@
+import numpy as np
 import pandas as pd
+from numba import njit
 
-from backtest.engine.portfolio import Portfolio
+from backtest.engine.order import BUY, SELL
+from backtest.engine.portfolio import SingleAssetPortfolio
+from backtest.engine.trade_log import TradeLog
 from backtest.strategies.base import Strategy
 
 
+@njit(cache=True, fastmath=True)
+def _simulate_col(
+    close: np.ndarray,
+    entries: np.ndarray,
+    exits: np.ndarray,
+    cash: float,
+    commission_pct: float,
+    out_equity: np.ndarray,
+    out_trade_idxs: np.ndarray,
+    out_trade_sides: np.ndarray,
+    out_trade_prices: np.ndarray,
+    out_trade_quantities: np.ndarray,
+) -> tuple[float, int, int]:
+    """
+    Execute entry/exit share counts at each bar's Close and mark to market.
+
+    Same rules as SingleAssetPortfolio.execute_order: a BUY is rejected if it would overdraw
+    cash, a SELL if fewer shares are held. Within a bar the BUY is tried first.
+
+    Writes the per-bar equity into out_equity and the accepted trades into the
+    out_trade_* arrays (bar index, side +1 BUY / -1 SELL, price, quantity), which
+    must hold 2 * len(close) entries. Returns final cash, final shares and the
+    number of trades written. All state is local, so independent columns can
+    run on separate threads.
+    """
+    n = len(close)
+    shares = 0
+    n_trades = 0
+
+    for i in range(n):
+        price = close[i]
+
+        # BUY leg, then SELL leg, through the same signed arithmetic
+        for sign, quantity in ((BUY, entries[i]), (SELL, exits[i])):
+            delta_cash = -sign * price * quantity * (1.0 + sign * commission_pct)
+            new_shares = shares + sign * quantity
+            # One rejection test covers both sides: a BUY may not overdraw cash
+            # and a SELL may not sell more than is held
+            if quantity > 0 and cash + delta_cash >= 0.0 and new_shares >= 0:
+                cash += delta_cash
+                shares = new_shares
+                out_trade_idxs[n_trades] = i
+                out_trade_sides[n_trades] = sign
+                out_trade_prices[n_trades] = price
+                out_trade_quantities[n_trades] = quantity
+                n_trades += 1
+
+        out_equity[i] = cash + shares * price
+
+    return cash, shares, n_trades
+
+
+@njit(cache=True)
+def _simulate(
+    close: np.ndarray,
+    entries: np.ndarray,
+    exits: np.ndarray,
+    cash: float,
+    commission_pct: float,
+) -> tuple[float, int, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Single-column _simulate_col with freshly allocated outputs.
+
+    Returns final cash, final shares, the per-bar equity array and the accepted
+    trades as parallel arrays: bar index, side, price, quantity.
+    """
+    n = len(close)
+    equity = np.empty(n, dtype=np.float64)
+    # At most one BUY and one SELL per bar
+    trade_idxs = np.empty(2 * n, dtype=np.int64)
+    trade_sides = np.empty(2 * n, dtype=np.int8)
+    trade_prices = np.empty(2 * n, dtype=np.float64)
+    trade_quantities = np.empty(2 * n, dtype=np.int64)
+
+    cash, shares, n_trades = _simulate_col(
+        close, entries, exits, cash, commission_pct,
+        equity, trade_idxs, trade_sides, trade_prices, trade_quantities,
+    )
+    return (
+        cash,
+        shares,
+        equity,
+        trade_idxs[:n_trades],
+        trade_sides[:n_trades],
+        trade_prices[:n_trades],
+        trade_quantities[:n_trades],
+    )
+
+
 def run_backtest(
     strategy: Strategy,
     data: pd.DataFrame,
     starting_capital: float,
     commission_pct: float,
-) -> tuple[Portfolio, int, list[dict]]:
+) -> tuple[SingleAssetPortfolio, int, TradeLog]:
     """
     Run a backtest over the full date range of `data`.
 
-    On each day, the strategy receives only history up to and including that day
-    (no lookahead bias). Orders are executed at that day's Close price.
+    The strategy turns the history into per-bar entry/exit signals once
+    (Strategy.vector_signals, which never looks past the bar being signalled),
+    then a Numba-compiled loop executes them at each day's Close price.
 
     Returns:
-        portfolio   - final Portfolio with equity_curve populated
+        portfolio   - final SingleAssetPortfolio with its dates/equities curve populated
         total_trades - count of all accepted orders
-        trade_log   - list of dicts with keys: side, price, quantity, ticker, date
+        trade_log   - TradeLog of accepted trades as parallel arrays
     """
-    portfolio = Portfolio(cash=starting_capital)
-    total_trades = 0
-    trade_log: list[dict] = []
-
-    for i in range(len(data)):
-        today = data.index[i]
-        history = data.iloc[: i + 1]  # CRITICAL: never expose future rows
-
-        orders = strategy.on_data(history)
-
-        close_price = float(data.at[today, "Close"])
-
-        for order in orders:
-            if portfolio.execute_order(order, close_price, commission_pct):
-                total_trades += 1
-                trade_log.append({
-                    "side": order.side,
-                    "price": close_price,
-                    "quantity": order.quantity,
-                    "ticker": order.ticker,
-                    "date": today,
-                })
-
-        # Price all current positions at today's close
-        prices = {ticker: close_price for ticker in portfolio.positions}
-        portfolio.log_equity(today, prices)
+    entries, exits = strategy.vector_signals(data)
+    close_arr = data["Close"].to_numpy(dtype=np.float64, copy=False)
+
+    cash, shares, equity, trade_idxs, trade_sides, trade_prices, trade_quantities = _simulate(
+        close_arr, entries, exits, starting_capital, commission_pct
+    )
+
+    ticker = getattr(strategy, "ticker", "")
+    portfolio = SingleAssetPortfolio(cash=float(cash), ticker=ticker, shares=int(shares))
+    portfolio.set_equity_curve(data.index.to_numpy(), equity)
+
+    trade_log = TradeLog(
+        ticker=ticker,
+        dates=data.index.to_numpy()[trade_idxs],
+        sides=trade_sides,
+        prices=trade_prices,
+        quantities=trade_quantities,
+    )
+    total_trades = len(trade_log)
 
     return portfolio, total_trades, trade_log
@@ -0,0 +1,151 @@
+import bottleneck as bn
+import numpy as np
+import pandas as pd
+from numba import njit, prange
+
+from backtest.engine.backtester import _simulate_col
+from backtest.strategies.base import clean_signals
+
+
+@njit(cache=True, parallel=True)
+def _clean_grid(
+    golden: np.ndarray, death: np.ndarray, quantity: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Apply clean_signals to every column of the raw golden/death-cross matrices in
+    parallel and scale to share counts, giving each combo the same position state
+    machine as SMACrossover.
+    """
+    n_bars, n_combos = golden.shape
+    # Allocated transposed so each combo's column is contiguous (Fortran order)
+    entries = np.zeros((n_combos, n_bars), dtype=np.int64).T
+    exits = np.zeros((n_combos, n_bars), dtype=np.int64).T
+
+    for j in prange(n_combos):
+        col_entries, col_exits = clean_signals(golden[:, j], death[:, j])
+        for i in range(n_bars):
+            if col_entries[i]:
+                entries[i, j] = quantity
+            elif col_exits[i]:
+                exits[i, j] = quantity
+
+    return entries, exits
+
+
+@njit(cache=True, parallel=True)
+def _simulate_grid(
+    close_2d: np.ndarray,
+    entries_2d: np.ndarray,
+    exits_2d: np.ndarray,
+    cash: float,
+    commission_pct: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run _simulate_col on every column of (n_bars, n_cols) inputs in parallel.
+
+    Columns are independent backtests — different tickers, parameter sets, or
+    both. Each thread writes only its own column of the equity matrix and uses
+    its own trade scratch buffers.
+
+    Returns the (n_bars, n_cols) equity matrix and final cash and trade count
+    per column.
+    """
+    n_bars, n_cols = close_2d.shape
+    # Transposed so each thread fills a contiguous block, not interleaved cache lines
+    equities = np.empty((n_cols, n_bars), dtype=np.float64).T
+    final_cash = np.empty(n_cols, dtype=np.float64)
+    n_trades = np.empty(n_cols, dtype=np.int64)
+
+    for j in prange(n_cols):
+        trade_idxs = np.empty(2 * n_bars, dtype=np.int64)
+        trade_sides = np.empty(2 * n_bars, dtype=np.int8)
+        trade_prices = np.empty(2 * n_bars, dtype=np.float64)
+        trade_quantities = np.empty(2 * n_bars, dtype=np.int64)
+        final_cash[j], _, n_trades[j] = _simulate_col(
+            close_2d[:, j], entries_2d[:, j], exits_2d[:, j], cash, commission_pct,
+            equities[:, j], trade_idxs, trade_sides, trade_prices, trade_quantities,
+        )
+
+    return equities, final_cash, n_trades
+
+
+def run_grid(
+    close: np.ndarray,
+    short_windows: list[int],
+    long_windows: list[int],
+    quantity: int,
+    starting_capital: float,
+    commission_pct: float,
+) -> pd.DataFrame:
+    """
+    Backtest SMACrossover for every (short_window, long_window) pair at once.
+
+    Each distinct window's SMA is computed once and broadcast into
+    (n_bars, n_combos) signal matrices; pairs with short_window >= long_window
+    are skipped (no valid pair gives an empty DataFrame). Windows longer than
+    the data never signal. The combos are simulated in parallel and match running
+    SMACrossover through run_backtest pair by pair.
+
+    Args:
+        close:            Close prices, oldest first
+        short_windows:    candidate short SMA windows
+        long_windows:     candidate long SMA windows
+        quantity:         shares per trade
+        starting_capital: cash at the start of every combo
+        commission_pct:   commission as a fraction of trade value
+
+    Returns a DataFrame indexed by (short_window, long_window) with columns
+    total_return_pct, final_equity, total_trades.
+    """
+    close = np.asarray(close, dtype=np.float64)
+
+    pairs = [(s, l) for s in short_windows for l in long_windows if s < l]
+    index = pd.MultiIndex.from_tuples(pairs, names=["short_window", "long_window"])
+    if not pairs:
+        return pd.DataFrame(
+            {
+                "total_return_pct": np.empty(0, dtype=np.float64),
+                "final_equity": np.empty(0, dtype=np.float64),
+                "total_trades": np.empty(0, dtype=np.int64),
+            },
+            index=index,
+        )
+
+    windows = sorted({w for pair in pairs for w in pair})
+    column = {w: k for k, w in enumerate(windows)}
+
+    # One moving average per distinct window, shape (n_bars, n_windows). A window
+    # longer than the data never fills: all-NaN, so that combo never signals
+    # (bottleneck itself rejects such windows)
+    smas = np.column_stack([
+        bn.move_mean(close, w) if w <= len(close) else np.full(len(close), np.nan)
+        for w in windows
+    ])
+    short_sma = smas[:, [column[s] for s, _ in pairs]]
+    long_sma = smas[:, [column[l] for _, l in pairs]]
+
+    # Yesterday's SMAs: shift down one bar; the NaN first row compares False
+    nan_row = np.full((1, len(pairs)), np.nan)
+    short_yesterday = np.vstack([nan_row, short_sma[:-1]])
+    long_yesterday = np.vstack([nan_row, long_sma[:-1]])
+
+    golden = (short_yesterday < long_yesterday) & (short_sma > long_sma)
+    death = (short_yesterday > long_yesterday) & (short_sma < long_sma)
+    # Fortran order keeps each combo's column contiguous for the per-column loops
+    entries, exits = _clean_grid(np.asfortranarray(golden), np.asfortranarray(death), quantity)
+
+    # Every combo trades the same prices: a zero-stride view, not n_combos copies
+    close_2d = np.broadcast_to(close[:, None], entries.shape)
+    equities, _, n_trades = _simulate_grid(
+        close_2d, entries, exits, starting_capital, commission_pct
+    )
+
+    final_equity = equities[-1]
+    return pd.DataFrame(
+        {
+            "total_return_pct": (final_equity - starting_capital) / starting_capital * 100,
+            "final_equity": final_equity,
+            "total_trades": n_trades,
+        },
+        index=index,
+    )
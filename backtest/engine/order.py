@@ -1,6 +1,10 @@
 from dataclasses import dataclass
 from typing import Literal
 
+# Signed side codes for array / compiled code: shares held change by sign * quantity
+BUY = 1
+SELL = -1
+
 
 @dataclass
 class Order:
@@ -1,13 +1,100 @@
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from backtest.engine.order import Order
 
 
-@dataclass
-class Portfolio:
+@dataclass(slots=True)
+class EquityCurve:
+    """Equity curve storage shared by the portfolio types: parallel arrays, one slot per bar."""
+
+    n_bars: int = field(default=0, kw_only=True)  # expected appends; the buffers double if exceeded
+    _dates: np.ndarray = field(init=False, repr=False)
+    _equities: np.ndarray = field(init=False, repr=False)
+    _n: int = field(init=False, repr=False, default=0)
+
+    def __post_init__(self) -> None:
+        self._dates = np.empty(self.n_bars, dtype="datetime64[ns]")
+        self._equities = np.empty(self.n_bars, dtype=np.float64)
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Dates of the logged equity values (datetime64[ns])."""
+        return self._dates[: self._n]
+
+    @property
+    def equities(self) -> np.ndarray:
+        """Logged total equity per bar (float64)."""
+        return self._equities[: self._n]
+
+    def _append_equity(self, date, equity: float) -> None:
+        if self._n == len(self._equities):
+            capacity = max(2 * self._n, 1)
+            self._dates = np.resize(self._dates, capacity)
+            self._equities = np.resize(self._equities, capacity)
+        self._dates[self._n] = date
+        self._equities[self._n] = equity
+        self._n += 1
+
+    def set_equity_curve(self, dates: np.ndarray, equities: np.ndarray) -> None:
+        """Replace the equity curve with precomputed per-bar arrays (no copy if already typed)."""
+        self._dates = np.asarray(dates, dtype="datetime64[ns]")
+        self._equities = np.asarray(equities, dtype=np.float64)
+        self._n = len(self._equities)
+
+
+@dataclass(slots=True)
+class SingleAssetPortfolio(EquityCurve):
+    """
+    Cash plus a scalar share count in one ticker — what run_backtest simulates.
+    Use Portfolio to hold several tickers.
+    """
+
+    cash: float
+    ticker: str
+    shares: int = 0
+
+    @property
+    def positions(self) -> dict[str, int]:
+        """{ticker: shares} while holding, else {} — same shape as Portfolio.positions."""
+        return {self.ticker: self.shares} if self.shares else {}
+
+    def execute_order(self, order: Order, price: float, commission_pct: float) -> bool:
+        """Execute a market order at the given price. Returns False if rejected."""
+        if order.ticker != self.ticker:
+            return False
+
+        if order.side == "BUY":
+            cost = price * order.quantity * (1 + commission_pct)
+            if cost > self.cash:
+                return False
+            self.cash -= cost
+            self.shares += order.quantity
+            return True
+
+        if order.side == "SELL":
+            if self.shares < order.quantity:
+                return False
+            self.cash += price * order.quantity * (1 - commission_pct)
+            self.shares -= order.quantity
+            return True
+
+        return False
+
+    def get_equity(self, price: float) -> float:
+        """Return total portfolio value at the given price: cash + shares * price."""
+        return self.cash + self.shares * price
+
+    def log_equity(self, date, price: float) -> None:
+        """Append today's total equity, valued at today's price, to the equity curve."""
+        self._append_equity(date, self.cash + self.shares * price)
+
+
+@dataclass(slots=True)
+class Portfolio(EquityCurve):
     cash: float
     positions: dict[str, int] = field(default_factory=dict)
-    equity_curve: list[dict] = field(default_factory=list)
 
     def execute_order(self, order: Order, price: float, commission_pct: float) -> bool:
         """Execute a market order at the given price. Returns False if rejected."""
@@ -37,6 +124,21 @@ class Portfolio:
             shares * prices[ticker] for ticker, shares in self.positions.items()
         )
 
-    def log_equity(self, date, prices: dict[str, float]) -> None:
-        """Append today's total equity to the equity curve."""
-        self.equity_curve.append({"date": date, "equity": self.get_equity(prices)})
+    def log_equity(self, date, prices: dict[str, float] | float) -> None:
+        """
+        Append today's total equity to the equity curve.
+
+        prices is either a {ticker: price} dict, or — when at most one ticker is
+        held — that ticker's last price as a plain float, which skips building
+        a prices dict every bar. For a single-ticker book, SingleAssetPortfolio
+        avoids the positions dict altogether.
+        """
+        if isinstance(prices, dict):
+            equity = self.get_equity(prices)
+        else:
+            if len(self.positions) > 1:
+                raise ValueError("A single last price can only value a single-ticker portfolio")
+            # Read from positions every time, so direct edits to it are honoured
+            equity = self.cash + next(iter(self.positions.values()), 0) * prices
+
+        self._append_equity(date, equity)
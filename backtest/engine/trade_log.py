@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class TradeLog:
+    """Accepted trades in execution order, one array slot per trade."""
+
+    ticker: str
+    dates: np.ndarray       # datetime64[ns]
+    sides: np.ndarray       # int8: order.BUY (+1) / order.SELL (-1)
+    prices: np.ndarray      # float64 fill price
+    quantities: np.ndarray  # int64 shares
+
+    def __len__(self) -> int:
+        return len(self.sides)
@@ -2,9 +2,13 @@ import math
 
 import numpy as np
 
+from backtest.config import TRADING_DAYS_PER_YEAR
+
+_ANNUALIZE_SHARPE = math.sqrt(TRADING_DAYS_PER_YEAR)
+
 
 def run_monte_carlo(
-    equity_curve: list[dict],
+    equity_curve: list[dict] | np.ndarray,
     n_simulations: int = 10_000,
     seed: int | None = None,
 ) -> dict:
@@ -16,7 +20,7 @@ def run_monte_carlo(
     had market conditions been slightly different.
 
     Args:
-        equity_curve:  list of {"date": ..., "equity": float} from Portfolio.equity_curve
+        equity_curve:  Portfolio.equities array, or a list of {"date": ..., "equity": float}
         n_simulations: number of bootstrap resamples (default 10,000)
         seed:          optional int for reproducible results
 
@@ -25,7 +29,13 @@ def run_monte_carlo(
     """
     rng = np.random.default_rng(seed)
 
-    equities = np.array([e["equity"] for e in equity_curve], dtype=float)
+    if isinstance(equity_curve, np.ndarray):
+        equities = equity_curve.astype(np.float64, copy=False)
+    else:
+        # One pass straight into a float64 array, no intermediate list
+        equities = np.fromiter(
+            (e["equity"] for e in equity_curve), dtype=np.float64, count=len(equity_curve)
+        )
     initial = equities[0]
 
     # Daily returns: the "deck of cards" to resample from
@@ -49,7 +59,7 @@ def run_monte_carlo(
         # Sharpe ratio (annualised)
         std = resampled.std()
         sharpe_ratios.append(
-            (resampled.mean() / std) * math.sqrt(252) if std != 0 else 0.0
+            (resampled.mean() / std) * _ANNUALIZE_SHARPE if std != 0 else 0.0
         )
 
         # Max drawdown
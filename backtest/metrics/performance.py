@@ -1,65 +1,74 @@
 import math
+from collections import deque
 
+import numpy as np
 import pandas as pd
 
+from backtest.config import TRADING_DAYS_PER_YEAR
+from backtest.engine.order import BUY
+from backtest.engine.trade_log import TradeLog
+
+_ANNUALIZE_SHARPE = math.sqrt(TRADING_DAYS_PER_YEAR)
+
 
 def compute_metrics(
-    equity_curve: list[dict],
+    dates: np.ndarray,
+    equities: np.ndarray,
     total_trades: int,
-    trade_log: list[dict],
+    trade_log: TradeLog,
     data: pd.DataFrame,
 ) -> dict:
     """
     Compute performance metrics from a completed backtest.
 
     Args:
-        equity_curve: list of {"date": ..., "equity": float} from Portfolio.equity_curve
+        dates:         datetime64 array from Portfolio.dates
+        equities:      float array of total equity per bar from Portfolio.equities
         total_trades:  count of all accepted orders
-        trade_log:     list of {"side", "price", "quantity", "ticker", "date"} from backtester
+        trade_log:     TradeLog of accepted trades from run_backtest
         data:          original OHLCV DataFrame (used for buy-and-hold benchmark)
 
     Returns a dict with keys:
         total_return_pct, annualized_return_pct, sharpe_ratio, max_drawdown_pct,
         total_trades, win_rate_pct, buy_and_hold_return_pct
     """
-    equities = [e["equity"] for e in equity_curve]
-    dates = [e["date"] for e in equity_curve]
+    eq = np.asarray(equities, dtype=np.float64)
+    dates = np.asarray(dates, dtype="datetime64[ns]")
 
-    initial = equities[0]
-    final = equities[-1]
+    initial = float(eq[0])
+    final = float(eq[-1])
 
     # --- Total return ---
     total_return_pct = (final - initial) / initial * 100
 
     # --- Annualized return ---
-    n_days = (dates[-1] - dates[0]).days
+    n_days = int((dates[-1] - dates[0]) // np.timedelta64(1, "D"))
     if n_days > 0:
         annualized_return_pct = ((final / initial) ** (365.0 / n_days) - 1) * 100
     else:
         annualized_return_pct = 0.0
 
     # --- Sharpe ratio (annualized) ---
-    daily_returns = pd.Series(equities).pct_change().dropna()
-    std = daily_returns.std()
-    sharpe_ratio = (daily_returns.mean() / std) * math.sqrt(252) if std != 0 else 0.0
+    daily_returns = np.diff(eq) / eq[:-1]
+    std = daily_returns.std(ddof=1) if len(daily_returns) > 1 else 0.0
+    sharpe_ratio = float(daily_returns.mean() / std * _ANNUALIZE_SHARPE) if std != 0 else 0.0
 
     # --- Max drawdown ---
-    equity_series = pd.Series(equities)
-    rolling_max = equity_series.cummax()
-    drawdown = (equity_series - rolling_max) / rolling_max * 100
+    rolling_max = np.maximum.accumulate(eq)
+    drawdown = (eq - rolling_max) / rolling_max * 100
     max_drawdown_pct = float(drawdown.min())
 
     # --- Win rate (round-trip trades) ---
     wins = 0
     completed = 0
-    pending_buys: list[float] = []
-    for trade in trade_log:
-        if trade["side"] == "BUY":
-            pending_buys.append(trade["price"])
-        elif trade["side"] == "SELL" and pending_buys:
-            buy_price = pending_buys.pop(0)
+    pending_buys: deque[float] = deque()  # FIFO: popleft is O(1)
+    for side, price in zip(trade_log.sides.tolist(), trade_log.prices.tolist()):
+        if side == BUY:
+            pending_buys.append(price)
+        elif pending_buys:
+            buy_price = pending_buys.popleft()
             completed += 1
-            if trade["price"] > buy_price:
+            if price > buy_price:
                 wins += 1
     win_rate_pct = (wins / completed * 100) if completed > 0 else 0.0
 
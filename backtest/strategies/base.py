@@ -1,15 +1,132 @@
+import math
 from abc import ABC, abstractmethod
+from collections import deque
 
+import numpy as np
 import pandas as pd
+from numba import njit
 
 from backtest.engine.order import Order
 
+# Relative variance threshold (var <= FLAT_VAR_RTOL * mean**2) below which a
+# window counts as flat: running sums leave rounding noise, not an exact 0
+FLAT_VAR_RTOL = 1e-12
+
 
 class Strategy(ABC):
+    __slots__ = ()  # lets subclasses that declare __slots__ drop the per-instance __dict__
+
+    # Number of bars before today that on_data needs to see in close_window
+    lookback: int = 0
+
+    def prepare(self, data: pd.DataFrame) -> None:
+        """
+        Called once with the full OHLCV DataFrame before the first on_data call.
+        Override to build per-bar lookups (e.g. aligning external data to the
+        index). Must not be used to peek at future prices.
+        """
+
     @abstractmethod
-    def on_data(self, history: pd.DataFrame) -> list[Order]:
+    def on_data(self, close_window: np.ndarray, today_idx: int) -> list[Order]:
         """
-        history: OHLCV DataFrame up to and including today. Index is Date.
+        close_window: Close prices of the last `lookback` bars plus today, oldest
+                      first (shorter near the start of the data). Today's Close
+                      is close_window[-1]. A read-only view — do not mutate.
+        today_idx:    position of today in the backtest data.
         Return a list of Orders to execute. Return empty list for no action.
         """
         pass
+
+    def vector_signals(self, data: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return (entries, exits): int64 arrays with one slot per bar holding the
+        number of shares to BUY / SELL at that bar's Close (0 = no order).
+
+        The default replays on_data bar by bar, merging same-side orders of a bar
+        into one. Strategies whose signals can be computed over the whole history
+        at once should override this — every value must still depend only on
+        bars up to and including its own (no lookahead bias).
+        """
+        self.prepare(data)
+        close_arr = data["Close"].to_numpy(dtype=np.float64, copy=False)
+        lookback = self.lookback
+
+        n = len(close_arr)
+        entries = np.zeros(n, dtype=np.int64)
+        exits = np.zeros(n, dtype=np.int64)
+
+        for i in range(n):
+            # CRITICAL: the window ends at today — never expose future rows
+            for order in self.on_data(close_arr[max(0, i - lookback): i + 1], i):
+                if order.side == "BUY":
+                    entries[i] += order.quantity
+                elif order.side == "SELL":
+                    exits[i] += order.quantity
+
+        return entries, exits
+
+
+class RollingWindow:
+    """
+    Trailing window over the last `size` values pushed, with a running sum and
+    sum of squares so mean/std update in O(1) per bar instead of re-scanning.
+    """
+
+    __slots__ = ("size", "_buf", "_sum", "_sumsq")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._buf: deque[float] = deque(maxlen=size)
+        self._sum = 0.0
+        self._sumsq = 0.0
+
+    def push(self, value: float) -> None:
+        if len(self._buf) == self.size:
+            old = self._buf[0]  # evicted by the append below
+            self._sum -= old
+            self._sumsq -= old * old
+        self._buf.append(value)
+        self._sum += value
+        self._sumsq += value * value
+
+    @property
+    def full(self) -> bool:
+        return len(self._buf) == self.size
+
+    def mean(self) -> float:
+        return self._sum / len(self._buf)
+
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1), as pandas rolling().std()."""
+        n = len(self._buf)
+        if n < 2:
+            return 0.0
+        mean = self._sum / n
+        var = (self._sumsq - n * mean * mean) / (n - 1)
+        if var <= FLAT_VAR_RTOL * mean * mean:
+            return 0.0
+        return math.sqrt(var)
+
+
+@njit(cache=True)
+def clean_signals(entries: np.ndarray, exits: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce raw boolean entry/exit conditions to alternating signals, starting flat.
+
+    Mirrors the `_in_position` state machine of the per-bar strategies: an entry
+    only fires while out of the market, an exit only while in it.
+    """
+    n = len(entries)
+    clean_entries = np.zeros(n, dtype=np.bool_)
+    clean_exits = np.zeros(n, dtype=np.bool_)
+    in_position = False
+
+    for i in range(n):
+        if entries[i] and not in_position:
+            in_position = True
+            clean_entries[i] = True
+        elif exits[i] and in_position:
+            in_position = False
+            clean_exits[i] = True
+
+    return clean_entries, clean_exits
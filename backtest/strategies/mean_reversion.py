@@ -1,10 +1,15 @@
+import bottleneck as bn
+import numpy as np
 import pandas as pd
 
 from backtest.engine.order import Order
-from backtest.strategies.base import Strategy
+from backtest.strategies.base import FLAT_VAR_RTOL, RollingWindow, Strategy, clean_signals
 
 
 class MeanReversion(Strategy):
+    # on_data keeps running window statistics: feed it every bar, in order.
+    __slots__ = ("ticker", "lookback", "entry_z", "exit_z", "quantity", "_in_position", "_window")
+
     def __init__(
         self,
         ticker: str,
@@ -19,19 +24,22 @@ class MeanReversion(Strategy):
         self.exit_z = exit_z
         self.quantity = quantity
         self._in_position: bool = False
+        self._window = RollingWindow(lookback)
 
-    def on_data(self, history: pd.DataFrame) -> list[Order]:
-        if len(history) < self.lookback:
+    def on_data(self, close_window: np.ndarray, today_idx: int) -> list[Order]:
+        close_today = float(close_window[-1])
+        window = self._window
+        window.push(close_today)
+        if not window.full:
             return []
 
-        closes = history["Close"]
-        rolling_mean = closes.rolling(self.lookback).mean().iloc[-1]
-        rolling_std = closes.rolling(self.lookback).std().iloc[-1]
+        rolling_mean = window.mean()
+        rolling_std = window.std()
 
         if rolling_std == 0:
             return []
 
-        z = (closes.iloc[-1] - rolling_mean) / rolling_std
+        z = (close_today - rolling_mean) / rolling_std
 
         # Price is abnormally low — expect a reversion upward
         if z < self.entry_z and not self._in_position:
@@ -44,3 +52,21 @@ class MeanReversion(Strategy):
             return [Order(self.ticker, "SELL", self.quantity)]
 
         return []
+
+    def vector_signals(self, data: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        closes = data["Close"].to_numpy(dtype=np.float64)
+        # bottleneck rejects windows longer than the data; on_data never fires there
+        if len(closes) < self.lookback:
+            return np.zeros(len(closes), dtype=np.int64), np.zeros(len(closes), dtype=np.int64)
+
+        rolling_mean = bn.move_mean(closes, self.lookback)
+        rolling_std = bn.move_std(closes, self.lookback, ddof=1)
+
+        # on_data skips flat windows; NaN compares False below. bottleneck leaves
+        # rounding noise, not 0, on a flat window that follows price movement
+        flat = rolling_std * rolling_std <= FLAT_VAR_RTOL * rolling_mean * rolling_mean
+        rolling_std[flat] = np.nan
+        z = (closes - rolling_mean) / rolling_std
+
+        entries, exits = clean_signals(z < self.entry_z, z > self.exit_z)
+        return entries * self.quantity, exits * self.quantity
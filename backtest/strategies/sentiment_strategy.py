@@ -1,5 +1,6 @@
 import datetime
 
+import numpy as np
 import pandas as pd
 
 from backtest.engine.order import Order
@@ -16,6 +17,11 @@ class SentimentStrategy(Strategy):
     dependencies — it only reads the CSV with pandas.
     """
 
+    __slots__ = (
+        "ticker", "buy_threshold", "sell_threshold", "quantity",
+        "_scores", "_in_position", "_bar_scores",
+    )
+
     def __init__(
         self,
         ticker: str,
@@ -45,20 +51,24 @@ class SentimentStrategy(Strategy):
             for idx, row in df.iterrows()
         }
 
-        self._last_known_score: float = 0.0
         self._in_position: bool = False
+        self._bar_scores: np.ndarray = np.empty(0)
 
     # ------------------------------------------------------------------
-    def on_data(self, history: pd.DataFrame) -> list[Order]:
-        raw_today = history.index[-1]
-        today: datetime.date = (
-            raw_today.date() if hasattr(raw_today, "date") else raw_today
+    def prepare(self, data: pd.DataFrame) -> None:
+        # Align scores to the bars once so on_data never touches the index.
+        # Forward-fill: a bar with no score of its own uses the last known one.
+        bar_days = pd.DatetimeIndex(data.index).date
+        self._bar_scores = (
+            pd.Series(self._scores, dtype=np.float64)
+            .reindex(bar_days)
+            .ffill()
+            .fillna(0.0)
+            .to_numpy()
         )
 
-        # Forward-fill: use last known score if today has no data
-        if today in self._scores:
-            self._last_known_score = self._scores[today]
-        score = self._last_known_score
+    def on_data(self, close_window: np.ndarray, today_idx: int) -> list[Order]:
+        score = self._bar_scores[today_idx]
 
         if score >= self.buy_threshold and not self._in_position:
             self._in_position = True
@@ -1,10 +1,29 @@
+import bottleneck as bn
+import numpy as np
 import pandas as pd
 
 from backtest.engine.order import Order
-from backtest.strategies.base import Strategy
+from backtest.strategies.base import RollingWindow, Strategy, clean_signals
+
+# SMAs closer than this (relative to the long SMA) count as equal: running sums
+# leave rounding noise where pandas' rolling mean returns exact ties, e.g. on
+# flat price stretches, and the strict crossover tests would fire on that noise
+_TIE_RTOL = 1e-12
+
+
+def _sma_spread(short_sma: float, long_sma: float) -> float:
+    """short_sma - long_sma, or 0.0 when the two SMAs are equal within _TIE_RTOL."""
+    spread = short_sma - long_sma
+    return 0.0 if abs(spread) <= _TIE_RTOL * abs(long_sma) else spread
 
 
 class SMACrossover(Strategy):
+    # on_data keeps running window sums: feed it every bar, in order.
+    __slots__ = (
+        "ticker", "short_window", "long_window", "quantity",
+        "_in_position", "_short", "_long", "_prev_smas",
+    )
+
     def __init__(
         self,
         ticker: str,
@@ -17,29 +36,58 @@ class SMACrossover(Strategy):
         self.long_window = long_window
         self.quantity = quantity
         self._in_position: bool = False
+        self._short = RollingWindow(short_window)
+        self._long = RollingWindow(long_window)
+        # Yesterday's SMAs; None until the long window has filled once
+        self._prev_smas: tuple[float, float] | None = None
 
-    def on_data(self, history: pd.DataFrame) -> list[Order]:
-        # Need long_window rows for today's SMA + 1 more for yesterday's — so long_window + 1 total
-        if len(history) < self.long_window + 1:
+    def on_data(self, close_window: np.ndarray, today_idx: int) -> list[Order]:
+        close_today = float(close_window[-1])
+        self._short.push(close_today)
+        self._long.push(close_today)
+        if not self._long.full:
             return []
 
-        closes = history["Close"]
-        short_sma = closes.rolling(self.short_window).mean()
-        long_sma = closes.rolling(self.long_window).mean()
-
-        short_today, short_yesterday = short_sma.iloc[-1], short_sma.iloc[-2]
-        long_today, long_yesterday = long_sma.iloc[-1], long_sma.iloc[-2]
+        short_today, long_today = self._short.mean(), self._long.mean()
+        prev_smas, self._prev_smas = self._prev_smas, (short_today, long_today)
+        # Need long_window rows for today's SMA + 1 more for yesterday's
+        if prev_smas is None:
+            return []
+        spread_yesterday = _sma_spread(*prev_smas)
+        spread_today = _sma_spread(short_today, long_today)
 
         # Golden cross: short crosses above long → BUY
-        if short_yesterday < long_yesterday and short_today > long_today:
+        if spread_yesterday < 0 and spread_today > 0:
             if not self._in_position:
                 self._in_position = True
                 return [Order(self.ticker, "BUY", self.quantity)]
 
         # Death cross: short crosses below long → SELL (only if holding)
-        elif short_yesterday > long_yesterday and short_today < long_today:
+        elif spread_yesterday > 0 and spread_today < 0:
             if self._in_position:
                 self._in_position = False
                 return [Order(self.ticker, "SELL", self.quantity)]
 
         return []
+
+    def vector_signals(self, data: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        closes = data["Close"].to_numpy(dtype=np.float64)
+        # bottleneck rejects windows longer than the data; on_data never fires there
+        if len(closes) < self.long_window:
+            return np.zeros(len(closes), dtype=np.int64), np.zeros(len(closes), dtype=np.int64)
+
+        short_today = bn.move_mean(closes, self.short_window)
+        long_today = bn.move_mean(closes, self.long_window)
+
+        # Same tie rule as _sma_spread: bottleneck's running sums can put equal
+        # SMAs an ulp apart
+        spread_today = short_today - long_today
+        spread_today[np.abs(spread_today) <= _TIE_RTOL * np.abs(long_today)] = 0.0
+        spread_yesterday = np.concatenate(([np.nan], spread_today[:-1]))
+
+        # NaN warm-up bars compare False, matching the long_window + 1 guard in on_data
+        golden = (spread_yesterday < 0) & (spread_today > 0)
+        death = (spread_yesterday > 0) & (spread_today < 0)
+
+        entries, exits = clean_signals(golden, death)
+        return entries * self.quantity, exits * self.quantity
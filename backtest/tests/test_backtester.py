@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -29,26 +30,33 @@ class BuyOnDayOneSellOnLastDay(Strategy):
         self._bought = False
         self._sold = False
 
-    def on_data(self, history: pd.DataFrame) -> list[Order]:
-        if len(history) == 1 and not self._bought:
+    def on_data(self, close_window: np.ndarray, today_idx: int) -> list[Order]:
+        if today_idx == 0 and not self._bought:
             self._bought = True
             return [Order(self.ticker, "BUY", self.quantity)]
-        if len(history) == self.total_days and not self._sold:
+        if today_idx == self.total_days - 1 and not self._sold:
             self._sold = True
             return [Order(self.ticker, "SELL", self.quantity)]
         return []
 
 
 class NoLookaheadStrategy(Strategy):
-    """Asserts that each call receives exactly one more row than the previous."""
+    """Asserts that each call receives a window ending on today, one day later than the previous."""
 
-    def __init__(self) -> None:
+    lookback = 3
+
+    def __init__(self, prices: list[float]) -> None:
+        self.prices = prices
         self._call_count = 0
 
-    def on_data(self, history: pd.DataFrame) -> list[Order]:
+    def on_data(self, close_window: np.ndarray, today_idx: int) -> list[Order]:
         self._call_count += 1
-        assert len(history) == self._call_count, (
-            f"Call {self._call_count}: expected {self._call_count} rows, got {len(history)}"
+        assert today_idx == self._call_count - 1, (
+            f"Call {self._call_count}: expected day {self._call_count - 1}, got {today_idx}"
+        )
+        expected = self.prices[max(0, today_idx - self.lookback): today_idx + 1]
+        assert list(close_window) == expected, (
+            f"Day {today_idx}: expected window {expected}, got {list(close_window)}"
         )
         return []
 
@@ -79,16 +87,16 @@ def test_final_equity_matches_manual_calculation():
 def test_equity_curve_has_one_entry_per_day():
     prices = [100.0, 105.0, 110.0]
     data = make_data(prices)
-    strategy = NoLookaheadStrategy()
+    strategy = NoLookaheadStrategy(prices)
     portfolio, _, _tl = run_backtest(strategy, data, starting_capital=10_000.0, commission_pct=0.0)
-    assert len(portfolio.equity_curve) == len(prices)
+    assert len(portfolio.dates) == len(portfolio.equities) == len(prices)
 
 
 def test_no_lookahead_bias():
     """Strategy asserts it only ever sees history up to the current day."""
     prices = [float(i) for i in range(1, 21)]
     data = make_data(prices)
-    strategy = NoLookaheadStrategy()
+    strategy = NoLookaheadStrategy(prices)
     # If lookahead bias exists, the assertion inside on_data will raise
     run_backtest(strategy, data, starting_capital=100_000.0, commission_pct=0.0)
     assert strategy._call_count == len(prices)
@@ -98,7 +106,7 @@ def test_rejected_order_not_counted_as_trade():
     """An order that the portfolio rejects should not increment trade count."""
 
     class AlwaysBuy(Strategy):
-        def on_data(self, history: pd.DataFrame) -> list[Order]:
+        def on_data(self, close_window: np.ndarray, today_idx: int) -> list[Order]:
             return [Order("TEST", "BUY", 999_999)]  # will overdraw cash
 
     data = make_data([100.0, 105.0])
@@ -106,3 +114,17 @@ def test_rejected_order_not_counted_as_trade():
         AlwaysBuy(), data, starting_capital=1_000.0, commission_pct=0.0
     )
     assert total_trades == 0
+
+
+def test_trade_log_records_accepted_trades():
+    prices = [100.0, 105.0, 110.0, 115.0, 120.0]
+    data = make_data(prices)
+    strategy = BuyOnDayOneSellOnLastDay("TEST", 10, total_days=5)
+    _, _, trade_log = run_backtest(strategy, data, starting_capital=10_000.0, commission_pct=0.0)
+
+    assert len(trade_log) == 2
+    assert trade_log.ticker == "TEST"
+    assert list(trade_log.sides) == [1, -1]
+    assert list(trade_log.prices) == [100.0, 120.0]
+    assert list(trade_log.quantities) == [10, 10]
+    assert list(trade_log.dates) == [data.index[0], data.index[-1]]
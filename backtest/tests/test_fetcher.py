@@ -0,0 +1,123 @@
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.data import fetcher
+from backtest.data.fetcher import _downcast, fetch_data
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def make_ohlcv(volume: list[int]) -> pd.DataFrame:
+    n = len(volume)
+    prices = np.linspace(100.0, 110.0, n)
+    return pd.DataFrame(
+        {
+            "Open": prices,
+            "High": prices + 1.0,
+            "Low": prices - 1.0,
+            "Close": prices,
+            "Volume": np.array(volume, dtype=np.int64),
+        },
+        index=pd.date_range("2023-01-02", periods=n, freq="B", name="Date"),
+    )
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the Parquet cache at tmp_path and start with an empty memo."""
+    monkeypatch.setattr(fetcher, "CACHE_DIR", tmp_path)
+    fetch_data.cache_clear()
+    yield tmp_path
+    fetch_data.cache_clear()
+
+
+def install_fake_yfinance(monkeypatch, history: pd.DataFrame) -> list:
+    """Replace yfinance with a stub whose history() returns `history`; returns the call log."""
+    calls = []
+
+    class Ticker:
+        def __init__(self, ticker):
+            self.ticker = ticker
+
+        def history(self, start, end, auto_adjust):
+            calls.append((self.ticker, start, end))
+            return history.copy()
+
+    monkeypatch.setitem(sys.modules, "yfinance", types.SimpleNamespace(Ticker=Ticker))
+    return calls
+
+
+# ---------------------------------------------------------------------------
+# _downcast
+# ---------------------------------------------------------------------------
+
+def test_downcast_prices_to_float32_and_volume_to_int32():
+    df = _downcast(make_ohlcv([1_000, 2_000, 3_000]))
+
+    for column in ["Open", "High", "Low", "Close"]:
+        assert df[column].dtype == np.float32
+    assert df["Volume"].dtype == np.int32
+    assert df["Volume"].tolist() == [1_000, 2_000, 3_000]
+
+
+def test_downcast_keeps_int64_volume_that_overflows_int32():
+    too_big = int(np.iinfo(np.int32).max) + 1
+    df = _downcast(make_ohlcv([1_000, too_big]))
+
+    assert df["Volume"].dtype == np.int64
+    assert df["Volume"].tolist() == [1_000, too_big]
+
+
+# ---------------------------------------------------------------------------
+# Parquet cache
+# ---------------------------------------------------------------------------
+
+def test_cache_hit_round_trips_index_and_dtypes(cache_dir, monkeypatch):
+    raw = make_ohlcv([1_000, 2_000, 3_000])
+    raw.index = raw.index.tz_localize("America/New_York")  # yfinance returns tz-aware dates
+    calls = install_fake_yfinance(monkeypatch, raw)
+
+    downloaded = fetch_data("TEST", "2023-01-02", "2023-01-05")
+    assert (cache_dir / "TEST_2023-01-02_2023-01-05.parquet").exists()
+
+    fetch_data.cache_clear()  # force the second call to read the Parquet file
+    cached = fetch_data("TEST", "2023-01-02", "2023-01-05")
+
+    assert len(calls) == 1
+    assert isinstance(cached.index, pd.DatetimeIndex)
+    assert cached.index.name == "Date"
+    assert cached.index.tz is None
+    for column in ["Open", "High", "Low", "Close"]:
+        assert cached[column].dtype == np.float32
+    assert cached["Volume"].dtype == np.int32
+    pd.testing.assert_frame_equal(cached, downloaded, check_freq=False)
+
+
+# ---------------------------------------------------------------------------
+# In-process memo
+# ---------------------------------------------------------------------------
+
+def test_repeated_fetch_skips_parquet_read(cache_dir, monkeypatch):
+    _downcast(make_ohlcv([1_000, 2_000])).to_parquet(
+        cache_dir / "TEST_2023-01-02_2023-01-04.parquet", engine="pyarrow"
+    )
+    reads = []
+    read_parquet = pd.read_parquet
+
+    def counting_read_parquet(*args, **kwargs):
+        reads.append(args)
+        return read_parquet(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_parquet", counting_read_parquet)
+
+    first = fetch_data("TEST", "2023-01-02", "2023-01-04")
+    second = fetch_data("TEST", "2023-01-02", "2023-01-04")
+
+    assert len(reads) == 1
+    assert second is first
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.engine.backtester import _simulate, run_backtest
+from backtest.engine.grid import _simulate_grid, run_grid
+from backtest.strategies.sma_crossover import SMACrossover
+
+
+def make_data(n: int = 1000, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    prices = 100.0 + np.cumsum(rng.normal(0.0, 1.0, n))
+    dates = pd.date_range("2020-01-01", periods=n, freq="B")
+    return pd.DataFrame({"Close": prices}, index=dates)
+
+
+def test_grid_matches_single_backtests():
+    data = make_data()
+    result = run_grid(
+        data["Close"].to_numpy(), [5, 10, 20], [10, 30], quantity=50,
+        starting_capital=100_000.0, commission_pct=0.001,
+    )
+
+    assert list(result.index) == [(5, 10), (5, 30), (10, 30), (20, 30)]
+    for short_window, long_window in result.index:
+        strategy = SMACrossover("TEST", short_window, long_window, quantity=50)
+        portfolio, total_trades, _ = run_backtest(strategy, data, 100_000.0, 0.001)
+        row = result.loc[(short_window, long_window)]
+        assert row["final_equity"] == pytest.approx(portfolio.equities[-1])
+        assert row["total_trades"] == total_trades
+
+
+def test_simulate_grid_columns_are_independent_backtests():
+    """Columns with different prices (e.g. tickers) match one _simulate call each."""
+    rng = np.random.default_rng(1)
+    n_bars, n_cols = 200, 4
+    close_2d = 100.0 + np.cumsum(rng.normal(0.0, 1.0, (n_bars, n_cols)), axis=0)
+    entries_2d = np.where(rng.random((n_bars, n_cols)) < 0.05, 10, 0)
+    exits_2d = np.where(rng.random((n_bars, n_cols)) < 0.05, 10, 0)
+
+    equities, final_cash, n_trades = _simulate_grid(
+        close_2d, entries_2d, exits_2d, 10_000.0, 0.001
+    )
+
+    for j in range(n_cols):
+        cash, _, equity, trade_idxs, *_ = _simulate(
+            close_2d[:, j], entries_2d[:, j], exits_2d[:, j], 10_000.0, 0.001
+        )
+        np.testing.assert_allclose(equities[:, j], equity)
+        assert final_cash[j] == pytest.approx(cash)
+        assert n_trades[j] == len(trade_idxs)
+
+
+def test_grid_with_no_valid_pairs_is_empty():
+    result = run_grid(
+        make_data()["Close"].to_numpy(), [5], [3], quantity=50,
+        starting_capital=100_000.0, commission_pct=0.001,
+    )
+
+    assert result.empty
+    assert list(result.index.names) == ["short_window", "long_window"]
+    assert list(result.columns) == ["total_return_pct", "final_equity", "total_trades"]
+
+
+def test_grid_window_longer_than_data_never_trades():
+    data = make_data(n=30)
+    result = run_grid(
+        data["Close"].to_numpy(), [5], [10, 50], quantity=50,
+        starting_capital=100_000.0, commission_pct=0.001,
+    )
+
+    row = result.loc[(5, 50)]
+    assert row["total_trades"] == 0
+    assert row["final_equity"] == 100_000.0
+    assert row["total_return_pct"] == 0.0
+
+    strategy = SMACrossover("TEST", 5, 10, quantity=50)
+    portfolio, total_trades, _ = run_backtest(strategy, data, 100_000.0, 0.001)
+    assert result.loc[(5, 10), "final_equity"] == pytest.approx(portfolio.equities[-1])
+    assert result.loc[(5, 10), "total_trades"] == total_trades
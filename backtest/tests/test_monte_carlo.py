@@ -97,3 +97,17 @@ def test_flat_equity_curve():
         assert result["sharpe_ratio"][pct_key] == pytest.approx(0.0), (
             f"sharpe_ratio[{pct_key}] should be 0 for flat curve"
         )
+
+
+# ---------------------------------------------------------------------------
+# Test 6: Array input matches the list-of-dicts input
+# ---------------------------------------------------------------------------
+
+def test_array_input_matches_list_input():
+    import numpy as np
+    equities = np.array([e["equity"] for e in SAMPLE_CURVE])
+
+    from_list = run_monte_carlo(SAMPLE_CURVE, n_simulations=100, seed=3)
+    from_array = run_monte_carlo(equities, n_simulations=100, seed=3)
+
+    assert from_list == from_array
@@ -0,0 +1,94 @@
+import math
+import statistics
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.engine.order import BUY, SELL
+from backtest.engine.trade_log import TradeLog
+from backtest.metrics.performance import compute_metrics
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def make_trade_log(trades: list[tuple[int, float]]) -> TradeLog:
+    """trades: (side, price) pairs in execution order, 10 shares each."""
+    n = len(trades)
+    return TradeLog(
+        ticker="TEST",
+        dates=pd.date_range("2023-01-02", periods=n, freq="B").to_numpy(),
+        sides=np.array([side for side, _ in trades], dtype=np.int8),
+        prices=np.array([price for _, price in trades], dtype=np.float64),
+        quantities=np.full(n, 10, dtype=np.int64),
+    )
+
+
+def run_metrics(equities: list[float], trades: list[tuple[int, float]]) -> dict:
+    dates = pd.date_range("2023-01-02", periods=len(equities), freq="B")
+    data = pd.DataFrame({"Close": equities}, index=dates)
+    return compute_metrics(
+        dates.to_numpy(), np.array(equities), len(trades), make_trade_log(trades), data
+    )
+
+
+EQUITIES = [100.0, 110.0, 99.0, 120.0]
+
+
+# ---------------------------------------------------------------------------
+# Win rate
+# ---------------------------------------------------------------------------
+
+def test_win_rate_matches_buys_first_in_first_out():
+    trades = [
+        (BUY, 10.0),
+        (BUY, 12.0),
+        (SELL, 11.0),  # closes the 10.0 BUY → win
+        (SELL, 11.0),  # closes the 12.0 BUY → loss
+        (BUY, 13.0),   # never closed: not a round trip
+    ]
+    metrics = run_metrics(EQUITIES, trades)
+
+    assert metrics["win_rate_pct"] == pytest.approx(50.0)
+    assert metrics["total_trades"] == 5
+
+
+def test_win_rate_losing_round_trip():
+    metrics = run_metrics(EQUITIES, [(BUY, 10.0), (SELL, 9.0)])
+    assert metrics["win_rate_pct"] == 0.0
+
+
+def test_win_rate_without_completed_round_trips():
+    metrics = run_metrics(EQUITIES, [(BUY, 10.0)])
+    assert metrics["win_rate_pct"] == 0.0
+
+
+# ---------------------------------------------------------------------------
+# Drawdown and Sharpe
+# ---------------------------------------------------------------------------
+
+def test_max_drawdown_from_running_peak():
+    metrics = run_metrics(EQUITIES, [])
+    # Peak 110 → trough 99
+    assert metrics["max_drawdown_pct"] == pytest.approx((99.0 - 110.0) / 110.0 * 100)
+
+
+def test_sharpe_ratio_annualized_sample_std():
+    metrics = run_metrics(EQUITIES, [])
+    returns = [b / a - 1 for a, b in zip(EQUITIES, EQUITIES[1:])]
+    expected = statistics.mean(returns) / statistics.stdev(returns) * math.sqrt(252)
+
+    assert metrics["sharpe_ratio"] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("equities", [[100.0], [100.0, 105.0]])
+def test_sharpe_ratio_is_zero_with_two_bars_or_fewer(equities):
+    metrics = run_metrics(equities, [])
+    assert metrics["sharpe_ratio"] == 0.0
+
+
+def test_sharpe_ratio_is_zero_for_flat_equity():
+    metrics = run_metrics([100.0] * 5, [])
+    assert metrics["sharpe_ratio"] == 0.0
@@ -1,7 +1,8 @@
+import numpy as np
 import pytest
 
 from backtest.engine.order import Order
-from backtest.engine.portfolio import Portfolio
+from backtest.engine.portfolio import Portfolio, SingleAssetPortfolio
 
 
 def make_portfolio(cash: float = 100_000.0) -> Portfolio:
@@ -101,6 +102,95 @@ def test_log_equity_appends_to_curve():
     p.log_equity(date(2023, 1, 3), {})
     p.log_equity(date(2023, 1, 4), {})
 
-    assert len(p.equity_curve) == 2
-    assert p.equity_curve[0] == {"date": date(2023, 1, 3), "equity": 100_000.0}
-    assert p.equity_curve[1] == {"date": date(2023, 1, 4), "equity": 100_000.0}
+    assert len(p.equities) == 2
+    assert list(p.dates) == [np.datetime64("2023-01-03"), np.datetime64("2023-01-04")]
+    assert list(p.equities) == [100_000.0, 100_000.0]
+
+
+def test_log_equity_from_last_price():
+    from datetime import date
+    p = make_portfolio(cash=100_000.0)
+    p.execute_order(Order("SPY", "BUY", 100), price=400.0, commission_pct=0.0)
+    p.log_equity(date(2023, 1, 3), 410.0)
+    p.execute_order(Order("SPY", "SELL", 40), price=410.0, commission_pct=0.0)
+    p.log_equity(date(2023, 1, 4), 420.0)
+
+    # 60000 + 100*410 = 101000;  (60000 + 40*410) + 60*420 = 101600
+    assert list(p.equities) == [pytest.approx(101_000.0), pytest.approx(101_600.0)]
+
+
+def test_log_equity_last_price_rejects_multiple_tickers():
+    from datetime import date
+    p = make_portfolio()
+    p.execute_order(Order("SPY", "BUY", 10), price=400.0, commission_pct=0.0)
+    p.execute_order(Order("AAPL", "BUY", 10), price=180.0, commission_pct=0.0)
+
+    with pytest.raises(ValueError):
+        p.log_equity(date(2023, 1, 3), 400.0)
+
+
+def test_log_equity_last_price_follows_ticker_change():
+    from datetime import date
+    p = make_portfolio(cash=10_000.0)
+    p.execute_order(Order("A", "BUY", 10), price=100.0, commission_pct=0.0)
+    p.execute_order(Order("A", "SELL", 10), price=100.0, commission_pct=0.0)
+    p.execute_order(Order("B", "BUY", 10), price=100.0, commission_pct=0.0)
+    p.log_equity(date(2023, 1, 3), 100.0)
+
+    assert p.equities[-1] == pytest.approx(p.get_equity({"B": 100.0}))  # 10000
+
+
+def test_log_equity_last_price_after_closing_first_ticker():
+    from datetime import date
+    p = make_portfolio(cash=10_000.0)
+    p.execute_order(Order("A", "BUY", 10), price=100.0, commission_pct=0.0)
+    p.execute_order(Order("B", "BUY", 10), price=100.0, commission_pct=0.0)
+    p.execute_order(Order("A", "SELL", 10), price=100.0, commission_pct=0.0)
+    p.log_equity(date(2023, 1, 3), 120.0)
+
+    assert p.equities[-1] == pytest.approx(p.get_equity({"B": 120.0}))  # 10200
+
+
+def test_log_equity_last_price_reads_positions_directly():
+    from datetime import date
+    p = Portfolio(cash=1_000.0, positions={"SPY": 10})
+    p.positions["SPY"] = 20
+    p.log_equity(date(2023, 1, 3), 100.0)
+
+    assert p.equities[-1] == pytest.approx(3_000.0)
+
+
+def test_log_equity_grows_past_n_bars():
+    from datetime import date
+    p = Portfolio(cash=100_000.0, n_bars=2)
+    for day in range(1, 6):
+        p.log_equity(date(2023, 1, day), {})
+
+    assert len(p.dates) == len(p.equities) == 5
+    assert p.dates[-1] == np.datetime64("2023-01-05")
+
+
+# --- SINGLE ASSET ---
+
+def test_single_asset_round_trip():
+    from datetime import date
+    p = SingleAssetPortfolio(cash=10_000.0, ticker="SPY")
+    assert p.execute_order(Order("SPY", "BUY", 10), price=100.0, commission_pct=0.001) is True
+    p.log_equity(date(2023, 1, 3), 110.0)
+    assert p.execute_order(Order("SPY", "SELL", 10), price=120.0, commission_pct=0.001) is True
+
+    # 10000 - 1001 + 1198.8
+    assert p.cash == pytest.approx(10_197.8)
+    assert p.shares == 0
+    assert p.positions == {}
+    assert p.equities[0] == pytest.approx(10_000.0 - 1001.0 + 1100.0)
+
+
+def test_single_asset_rejects_invalid_orders():
+    p = SingleAssetPortfolio(cash=500.0, ticker="SPY")
+
+    assert p.execute_order(Order("SPY", "BUY", 100), price=400.0, commission_pct=0.0) is False
+    assert p.execute_order(Order("SPY", "SELL", 1), price=400.0, commission_pct=0.0) is False
+    assert p.execute_order(Order("AAPL", "BUY", 1), price=100.0, commission_pct=0.0) is False
+    assert p.cash == 500.0
+    assert p.shares == 0
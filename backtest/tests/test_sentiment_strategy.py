@@ -37,8 +37,10 @@ def _make_ohlcv(dates: list[datetime.date]) -> pd.DataFrame:
 
 
 def _run_strategy(strategy: SentimentStrategy, df: pd.DataFrame) -> list[list]:
-    """Simulate the backtester's day-by-day history slicing."""
-    return [strategy.on_data(df.iloc[: i + 1]) for i in range(len(df))]
+    """Simulate the backtester's day-by-day replay of on_data."""
+    strategy.prepare(df)
+    closes = df["Close"].to_numpy()
+    return [strategy.on_data(closes[: i + 1], i) for i in range(len(df))]
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.strategies.base import Strategy, clean_signals
+from backtest.strategies.mean_reversion import MeanReversion
+from backtest.strategies.sma_crossover import SMACrossover
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def make_data(n: int = 2000, seed: int = 0) -> pd.DataFrame:
+    """Random-walk Close prices, enough bars to trigger plenty of signals."""
+    rng = np.random.default_rng(seed)
+    prices = 100.0 + np.cumsum(rng.normal(0.0, 1.0, n))
+    dates = pd.date_range("2023-01-01", periods=n, freq="B")
+    return pd.DataFrame({"Close": prices}, index=dates)
+
+
+def make_penny_data(n: int = 500, seed: int = 0) -> pd.DataFrame:
+    """Random walk rounded to cents and stored as float32, like fetched prices."""
+    rng = np.random.default_rng(seed)
+    prices = np.round(100.0 + np.cumsum(rng.normal(0.0, 1.0, n)), 2).astype(np.float32)
+    dates = pd.date_range("2023-01-01", periods=n, freq="B")
+    return pd.DataFrame({"Close": prices.astype(np.float64)}, index=dates)
+
+
+def make_flat_run_data(seed: int) -> pd.DataFrame:
+    """Random walk with a 25-bar flat stretch in the middle, float64 throughout."""
+    rng = np.random.default_rng(seed)
+    head = 100.0 + np.cumsum(rng.normal(0.0, 1.0, 40))
+    tail = head[-1] + np.cumsum(rng.normal(0.0, 1.0, 40))
+    prices = np.concatenate([head, np.full(25, head[-1]), tail])
+    dates = pd.date_range("2023-01-01", periods=len(prices), freq="B")
+    return pd.DataFrame({"Close": prices}, index=dates)
+
+
+def pandas_sma_signals(
+    data: pd.DataFrame, short_window: int, long_window: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Crossover entries/exits from pandas rolling means with strict comparisons (original rules)."""
+    closes = data["Close"]
+    short_sma = closes.rolling(short_window).mean()
+    long_sma = closes.rolling(long_window).mean()
+    golden = (short_sma.shift() < long_sma.shift()) & (short_sma > long_sma)
+    death = (short_sma.shift() > long_sma.shift()) & (short_sma < long_sma)
+    return clean_signals(golden.to_numpy(), death.to_numpy())
+
+
+def replay_on_data(strategy: Strategy, data: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """Signals from the per-bar path, via the base-class default implementation."""
+    return Strategy.vector_signals(strategy, data)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("make_strategy", [
+    lambda: MeanReversion("TEST", lookback=10, entry_z=-1.0, exit_z=0.0, quantity=5),
+    lambda: SMACrossover("TEST", short_window=5, long_window=15, quantity=5),
+])
+def test_vector_signals_match_on_data(make_strategy):
+    data = make_data()
+    entries, exits = make_strategy().vector_signals(data)
+    expected_entries, expected_exits = replay_on_data(make_strategy(), data)
+
+    assert entries.sum() > 0, "test data should produce at least one entry"
+    np.testing.assert_array_equal(entries, expected_entries)
+    np.testing.assert_array_equal(exits, expected_exits)
+
+
+def test_mean_reversion_skips_flat_window():
+    data = pd.DataFrame(
+        {"Close": [100.0] * 30},
+        index=pd.date_range("2023-01-01", periods=30, freq="B"),
+    )
+    for entries, exits in (
+        MeanReversion("TEST", lookback=10).vector_signals(data),
+        replay_on_data(MeanReversion("TEST", lookback=10), data),
+    ):
+        assert entries.sum() == 0
+        assert exits.sum() == 0
+
+
+@pytest.mark.parametrize("make_strategy", [
+    lambda: MeanReversion("TEST", lookback=30),
+    lambda: SMACrossover("TEST", short_window=20, long_window=50),
+])
+def test_vector_signals_with_fewer_bars_than_window(make_strategy):
+    data = make_data(n=21)
+    entries, exits = make_strategy().vector_signals(data)
+    expected_entries, expected_exits = replay_on_data(make_strategy(), data)
+
+    assert entries.dtype == np.int64 and exits.dtype == np.int64
+    np.testing.assert_array_equal(entries, expected_entries)
+    np.testing.assert_array_equal(exits, expected_exits)
+    assert entries.sum() == 0 and exits.sum() == 0
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_sma_ignores_rounding_noise_on_flat_run(seed):
+    """Equal SMAs over a flat stretch are a tie, not a cross, as with pandas' exact rolling means."""
+    data = make_flat_run_data(seed)
+    expected_entries, expected_exits = pandas_sma_signals(data, 5, 15)
+    for entries, exits in (
+        SMACrossover("TEST", 5, 15, quantity=1).vector_signals(data),
+        replay_on_data(SMACrossover("TEST", 5, 15, quantity=1), data),
+    ):
+        np.testing.assert_array_equal(entries, expected_entries)
+        np.testing.assert_array_equal(exits, expected_exits)
+
+
+# Seeds whose penny prices give SMAs that tie exactly under pandas
+@pytest.mark.parametrize("seed", [20, 126, 242, 299])
+def test_sma_vector_signals_match_on_tied_smas(seed):
+    data = make_penny_data(seed=seed)
+    entries, exits = SMACrossover("TEST", 5, 15, quantity=1).vector_signals(data)
+    expected_entries, expected_exits = pandas_sma_signals(data, 5, 15)
+
+    np.testing.assert_array_equal(entries, expected_entries)
+    np.testing.assert_array_equal(exits, expected_exits)
+    replay_entries, replay_exits = replay_on_data(SMACrossover("TEST", 5, 15, quantity=1), data)
+    np.testing.assert_array_equal(entries, replay_entries)
+    np.testing.assert_array_equal(exits, replay_exits)
+
+
+# Seeds whose bottleneck std over the flat run is rounding noise, not 0
+@pytest.mark.parametrize("seed", [3, 41, 47, 128])
+def test_mean_reversion_skips_flat_run_after_movement(seed):
+    data = make_flat_run_data(seed)
+    entries, exits = MeanReversion("TEST", lookback=10, entry_z=-1.0).vector_signals(data)
+    expected_entries, expected_exits = replay_on_data(
+        MeanReversion("TEST", lookback=10, entry_z=-1.0), data
+    )
+
+    np.testing.assert_array_equal(entries, expected_entries)
+    np.testing.assert_array_equal(exits, expected_exits)
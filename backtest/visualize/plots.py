@@ -1,13 +1,14 @@
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 OUTPUT_DIR = Path("output")
 
 
 def plot_results(
-    equity_curve: list[dict],
+    dates: np.ndarray,
+    equities: np.ndarray,
     data: pd.DataFrame,
     starting_capital: float,
     output_dir: Path = OUTPUT_DIR,
@@ -18,17 +19,13 @@ def plot_results(
       1. equity_curve.png — strategy equity vs buy-and-hold benchmark
       2. drawdown.png     — percentage drawdown over time (filled area)
     """
-    output_dir.mkdir(exist_ok=True)
+    import matplotlib.pyplot as plt  # deferred: slow to import, only needed to plot
 
-    dates = [e["date"] for e in equity_curve]
-    equities = [e["equity"] for e in equity_curve]
+    output_dir.mkdir(exist_ok=True)
 
     # Buy-and-hold: scale starting capital by price return each day
     initial_price = float(data["Close"].iloc[0])
-    bah_equities = [
-        starting_capital * (float(data.at[d, "Close"]) / initial_price)
-        for d in dates
-    ]
+    bah_equities = starting_capital * (data.loc[dates, "Close"].to_numpy() / initial_price)
 
     # --- Chart 1: Equity curve ---
     fig, ax = plt.subplots(figsize=(12, 5))
@@ -46,9 +43,8 @@ def plot_results(
     plt.close(fig)
 
     # --- Chart 2: Drawdown ---
-    equity_series = pd.Series(equities)
-    rolling_max = equity_series.cummax()
-    drawdown = (equity_series - rolling_max) / rolling_max * 100
+    rolling_max = np.maximum.accumulate(equities)
+    drawdown = (equities - rolling_max) / rolling_max * 100
 
     fig, ax = plt.subplots(figsize=(12, 4))
     ax.fill_between(dates, drawdown, 0, alpha=0.4, color="red", label="Drawdown")
@@ -80,6 +76,8 @@ def plot_monte_carlo(
         output_dir:              directory to save the chart
         show:                    if True, call plt.show() after saving
     """
+    import matplotlib.pyplot as plt
+
     output_dir.mkdir(exist_ok=True)
 
     all_returns = mc_result["all_total_returns"]
@@ -10,7 +10,6 @@ from backtest.config import (
 from backtest.data.fetcher import fetch_data
 from backtest.engine.backtester import run_backtest
 from backtest.metrics.performance import compute_metrics
-from backtest.visualize.plots import plot_monte_carlo, plot_results
 
 
 def _build_strategy(name: str, ticker: str, sentiment_csv: str | None = None,
@@ -138,16 +137,20 @@ def main() -> None:
         strategy, data, args.capital, COMMISSION_PCT
     )
 
-    metrics = compute_metrics(portfolio.equity_curve, total_trades, trade_log, data)
+    metrics = compute_metrics(
+        portfolio.dates, portfolio.equities, total_trades, trade_log, data
+    )
     _print_metrics(metrics, args)
 
-    plot_results(portfolio.equity_curve, data, args.capital)
+    from backtest.visualize.plots import plot_monte_carlo, plot_results
+
+    plot_results(portfolio.dates, portfolio.equities, data, args.capital)
     print("Charts saved to  output/equity_curve.png  and  output/drawdown.png")
 
     if args.monte_carlo:
         from backtest.metrics.monte_carlo import run_monte_carlo
         print(f"\nRunning Monte Carlo simulation ({args.mc_sims:,} runs) ...")
-        mc = run_monte_carlo(portfolio.equity_curve, n_simulations=args.mc_sims)
+        mc = run_monte_carlo(portfolio.equities, n_simulations=args.mc_sims)
         _print_monte_carlo(mc)
         plot_monte_carlo(mc, metrics["total_return_pct"])
         print("Chart saved to   output/monte_carlo.png")